@@ -11,6 +11,10 @@ extensions = [
         name='pylibcsv',
         sources=['src/libcsv.py'],
     ),
+    Extension(
+        name='_csvaccel',
+        sources=['src/_csvaccel.pyx'],
+    ),
 ]
 
 setup(
@@ -18,5 +22,10 @@ setup(
     ext_modules=cythonize(
         module_list=extensions,
         language_level=3,
+        # where the augmenting pylibcsv.pxd is found
+        include_path=['src'],
+        # annotation-derived signatures would conflict with the cpdef
+        # declaration in pylibcsv.pxd, so let the .pxd alone do the typing
+        compiler_directives={'annotation_typing': False},
     ),
 )
@@ -0,0 +1,18 @@
+"""Alternative setuptools setup file for pylibcsv, using mypyc.
+
+This file builds the pylibcsv package with mypyc instead of Cython. The
+module's existing type hints are enough for mypyc to emit C with
+specialized str/list/dict fast paths, so no .pxd declarations are
+needed. Build with: python setup_mypyc.py build_ext --inplace
+"""
+
+from mypyc.build import mypycify  # type: ignore[import-untyped]
+from setuptools import setup
+
+setup(
+    name='pylibcsv',
+    ext_modules=mypycify(['src/libcsv.py']),
+    # no pure-Python packages to install; also keeps setuptools from
+    # auto-detecting a src layout, which would break --inplace builds
+    packages=[],
+)
@@ -0,0 +1,44 @@
+# cython: language_level=3
+"""Cython accelerator for the column-mask filter loop.
+
+Compiled by setup.py alongside the main module. libcsv falls back to an
+equivalent pure-Python loop when this extension has not been built, so
+the accelerator is strictly optional.
+"""
+
+cimport cython
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def apply_column_mask(
+    bytearray row_mask,
+    list column,
+    list conditions,
+):
+    """Clear mask bytes for rows whose cell fails every condition.
+
+    The loop body matches the pure-Python fallback in libcsv, but runs
+    with C-level loop variables and unchecked list/bytearray indexing,
+    avoiding the per-iteration interpreter overhead of the hot path.
+    """
+    cdef Py_ssize_t row_index
+    cdef Py_ssize_t row_count = len(column)
+    cdef str cell
+    cdef bint satisfied
+    cdef object op_function, value
+
+    for row_index in range(row_count):
+        if not row_mask[row_index]:
+            continue
+
+        cell = <str> column[row_index]
+        satisfied = False
+
+        for op_function, value in conditions:
+            if op_function(cell, value):
+                satisfied = True
+                break
+
+        if not satisfied:
+            row_mask[row_index] = 0
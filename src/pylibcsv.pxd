@@ -0,0 +1,19 @@
+# Cython augmentation for the pylibcsv extension built from libcsv.py.
+#
+# The setup.py build already runs cythonize over the pure-Python module,
+# but without declarations the generated C keeps every operation generic.
+# Typing the hot predicate here lets Cython emit direct PyUnicode string
+# comparisons and C-level loop variables, while plain Python imports of
+# libcsv.py ignore this file entirely. The file is matched against the
+# extension name (pylibcsv), not the source file name, through the
+# include path that setup.py passes to cythonize.
+cimport cython
+
+
+@cython.locals(
+    column_index=cython.Py_ssize_t,
+    cell=str,
+    value=str,
+    column_satisfies_conditions=cython.bint,
+)
+cpdef bint row_meets_filters(list row, list filter_plan)
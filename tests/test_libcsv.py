@@ -1,5 +1,7 @@
 """Unit tests for libcsv."""
 
+import importlib.util
+import io
 import pathlib
 from dataclasses import dataclass
 
@@ -134,3 +136,187 @@ def test_process_csv_file(
         captured_output = str(err) + '\n'
 
     assert captured_output == expected_output, 'Output mismatch'
+
+
+@pytest.mark.parametrize(
+    (
+        'csv_data',
+        'selected_columns',
+        'row_filter_definitions',
+        'expected_output',
+    ),
+    params,
+)
+def test_process_csv_stream_variants(
+    csv_data: str,
+    selected_columns: str,
+    row_filter_definitions: str,
+    expected_output: str,
+) -> None:
+    """Test the stream-based entry points.
+
+    Covers process_csv_stream and process_csv_data_to (which drives
+    process_csv_stream_to internally).
+
+    Args:
+    ----
+        csv_data (str): CSV data to be processed.
+        selected_columns (str): Columns to be selected from the CSV data.
+        row_filter_definitions (str): Filters to be applied to the CSV data.
+        expected_output (str): Expected output of the function.
+
+    """
+    try:
+        stream_output = libcsv.process_csv_stream(
+            io.StringIO(csv_data),
+            selected_columns,
+            row_filter_definitions,
+        )
+
+    except ValueError as err:
+        stream_output = str(err) + '\n'
+
+    output_buffer = io.StringIO()
+
+    try:
+        libcsv.process_csv_data_to(
+            csv_data,
+            selected_columns,
+            row_filter_definitions,
+            output_buffer,
+        )
+        written_output = output_buffer.getvalue()
+
+    except ValueError as err:
+        written_output = str(err) + '\n'
+
+    assert stream_output == expected_output, 'Output mismatch'
+    assert written_output == expected_output, 'Output mismatch'
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec('pyarrow') is None,
+    reason='pyarrow is not installed',
+)
+@pytest.mark.parametrize(
+    (
+        'csv_data',
+        'selected_columns',
+        'row_filter_definitions',
+        'expected_output',
+    ),
+    params,
+)
+def test_process_csv_data_arrow(
+    csv_data: str,
+    selected_columns: str,
+    row_filter_definitions: str,
+    expected_output: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the pyarrow path against the same cases as the Python path.
+
+    The pyarrow path normally only handles inputs of at least
+    ARROW_MIN_BYTES; lowering the threshold to zero routes every test case
+    through it.
+
+    Args:
+    ----
+        csv_data (str): CSV data to be processed.
+        selected_columns (str): Columns to be selected from the CSV data.
+        row_filter_definitions (str): Filters to be applied to the CSV data.
+        expected_output (str): Expected output of the function.
+        monkeypatch (pytest.MonkeyPatch): Patching fixture provided by pytest.
+
+    """
+    monkeypatch.setattr(libcsv, 'ARROW_MIN_BYTES', 0)
+
+    try:
+        captured_output = libcsv.process_csv_data(
+            csv_data,
+            selected_columns,
+            row_filter_definitions,
+        )
+
+    except ValueError as err:
+        captured_output = str(err) + '\n'
+
+    assert captured_output == expected_output, 'Output mismatch'
+
+
+def test_process_csv_file_cache_reuse(tmp_path: pathlib.Path) -> None:
+    """Test repeated processing of one file through the caches.
+
+    The second call hits the parsed-row cache and, since the filters are
+    unchanged, the predicate-mask cache; both results must still match.
+
+    Args:
+    ----
+        tmp_path (pathlib.Path): Temporary path provided by pytest.
+
+    """
+    libcsv.clear_cache()
+    csv_file_path = tmp_path / 'test.csv'
+    csv_file_path.write_text(standard_test_case_data)
+
+    first_output = libcsv.process_csv_file(
+        str(csv_file_path),
+        'header1',
+        'header2>3',
+    )
+    second_output = libcsv.process_csv_file(
+        str(csv_file_path),
+        'header3',
+        'header2>3',
+    )
+
+    assert first_output == 'header1\n4\n7\n', 'Output mismatch'
+    assert second_output == 'header3\n6\n9\n', 'Output mismatch'
+
+
+def test_process_csv_file_cache_invalidation(tmp_path: pathlib.Path) -> None:
+    """Test that rewriting a file on disk invalidates its cached rows.
+
+    Args:
+    ----
+        tmp_path (pathlib.Path): Temporary path provided by pytest.
+
+    """
+    libcsv.clear_cache()
+    csv_file_path = tmp_path / 'test.csv'
+    csv_file_path.write_text('header1,header2\n1,2\n')
+
+    first_output = libcsv.process_csv_file(str(csv_file_path), '', '')
+
+    # different size, so the file fingerprint changes even if the
+    # modification time does not
+    csv_file_path.write_text('header1,header2\n3,4\n5,6\n')
+    second_output = libcsv.process_csv_file(str(csv_file_path), '', '')
+
+    assert first_output == 'header1,header2\n1,2\n', 'Output mismatch'
+    assert second_output == 'header1,header2\n3,4\n5,6\n', 'Output mismatch'
+
+
+def test_process_csv_file_streaming_fallback(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the uncached streaming path taken by files over the cache cap.
+
+    Args:
+    ----
+        tmp_path (pathlib.Path): Temporary path provided by pytest.
+        monkeypatch (pytest.MonkeyPatch): Patching fixture provided by pytest.
+
+    """
+    monkeypatch.setattr(libcsv, 'MAX_CACHE_BYTES', 0)
+    csv_file_path = tmp_path / 'test.csv'
+    csv_file_path.write_text(standard_test_case_data)
+
+    captured_output = libcsv.process_csv_file(
+        str(csv_file_path),
+        'header1,header3',
+        'header1>1',
+    )
+
+    assert captured_output == 'header1,header3\n4,6\n7,9\n', 'Output mismatch'